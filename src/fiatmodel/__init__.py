@@ -5,6 +5,13 @@
 """FIATModel main entry point"""
 from .core import *
 
+
+def __getattr__(name):
+    # globals of `core` built on first access (e.g., the Pint registry)
+    if name in ('ureg', 'MYENV'):
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 available_model_software = [
     'mesh',
 ]
@@ -25,6 +25,12 @@ available_model_software = {
     'ostrich': ['mesh'],
 }
 
+# immutable views of the above for O(1) membership tests
+_available_calibration_software_set = frozenset(available_calibration_software)
+_available_model_software_sets = {
+    k: frozenset(v) for k, v in available_model_software.items()
+}
+
 # OSTRICH's templating engine
 # These imports can be streamlined in future versions
 from .ostrich.templating import OstrichTemplateEngine
@@ -14,33 +14,222 @@ path handling, and validation helpers).
 # built-in imports
 import sys
 import os
+import json
+import shutil
+import stat
+import tempfile
+import functools
 import warnings
 
+from concurrent.futures import ThreadPoolExecutor
 from importlib.resources import files
 
 from typing import (
+    TYPE_CHECKING,
     Dict,
+    Tuple,
     Union,
+    Optional,
+    TypeAlias,
 )
 from pathlib import Path
 
+# `fcntl` is only available on POSIX platforms
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # 3rd party imports
-import jinja2
+# `jinja2` is imported lazily when the first engine is constructed
+if TYPE_CHECKING:
+    import jinja2
 
 # internal imports
 from . import (
-    available_calibration_software,
-    available_model_software,
+    _available_calibration_software_set,
+    _available_model_software_sets,
 )
+from ..__about__ import __version__
 
 # defining custom types
-if sys.version_info >= (3, 10):
-    from typing import TypeAlias
-    PathLike: TypeAlias = Union[str, Path]
-else:
-    PathLike = Union[str, Path]
+PathLike: TypeAlias = Union[str, Path]
 
 # global variables and helper functions
+# Jinja2 environments shared by all engine instances, keyed by the
+# template directory of each calibration software, whether the
+# on-disk bytecode cache is used, and the precompiled template
+# directory (if any)
+_ENV_CACHE: Dict[Tuple[str, bool, Optional[str]], 'jinja2.Environment'] = {}
+# environment variable pointing to precompiled templates, see
+# `OptimizerTemplateEngine._precompile`
+JINJA_CACHE_ENV = 'FIAT_JINJA_CACHE'
+# Linux `FICLONE` ioctl request, sharing the extents of a file on
+# copy-on-write file systems (e.g., Btrfs, XFS)
+_FICLONE = 0x40049409 if (fcntl is not None and sys.platform.startswith('linux')) else None
+
+@functools.lru_cache(maxsize=None)
+def _template_dir(calibration_software: str) -> str:
+    """Resolve the packaged template directory of a calibration software.
+
+    Parameters
+    ----------
+    calibration_software : str
+        Name of the calibration engine (e.g., ``"ostrich"``).
+
+    Returns
+    -------
+    str
+        Path to the ``templates`` directory of ``calibration_software``.
+    """
+    return os.path.join(
+        str(files(__package__)),
+        calibration_software,
+        "templates")
+
+def _precompiled_path(
+    cache_dir: PathLike,
+    calibration_software: str,
+) -> str:
+    """Return where the precompiled templates of a calibration software go.
+
+    Parameters
+    ----------
+    cache_dir : PathLike
+        Base directory of the precompiled templates.
+    calibration_software : str
+        Name of the calibration engine (e.g., ``"ostrich"``).
+
+    Returns
+    -------
+    str
+        ``<cache_dir>/<fiatmodel version>/<calibration_software>``.
+    """
+    return os.path.join(os.fspath(cache_dir), __version__, calibration_software)
+
+def _precompiled_dir(calibration_software: str) -> Optional[str]:
+    """Locate precompiled templates of a calibration software.
+
+    Parameters
+    ----------
+    calibration_software : str
+        Name of the calibration engine (e.g., ``"ostrich"``).
+
+    Returns
+    -------
+    str or None
+        ``$FIAT_JINJA_CACHE/<version>/<calibration_software>`` if the
+        environment variable is set and the directory exists; otherwise
+        ``None``.
+
+    Notes
+    -----
+    Precompiled templates take precedence over the packaged sources and
+    are never checked against them. They are therefore keyed on the
+    installed ``fiatmodel`` version: after an upgrade, templates compiled
+    for the previous version are ignored until they are compiled again
+    (see ``OptimizerTemplateEngine._precompile``). Editable installs whose
+    templates change without a version bump must recompile them, or
+    unset ``FIAT_JINJA_CACHE``.
+    """
+    cache_dir = os.environ.get(JINJA_CACHE_ENV)
+    if not cache_dir:
+        return None
+
+    module_path = _precompiled_path(cache_dir, calibration_software)
+    if not os.path.isdir(module_path):
+        return None
+
+    return module_path
+
+def _get_environment(
+    package_path: str,
+    bytecode_cache: bool = True,
+    module_path: Optional[str] = None,
+    template_globals: Optional[Dict] = None,
+) -> 'jinja2.Environment':
+    """Build (or reuse) the Jinja2 environment of a template directory.
+
+    Parameters
+    ----------
+    package_path : str
+        Directory containing the ``.jinja2`` template sources.
+    bytecode_cache : bool, default ``True``
+        Whether compiled templates are cached on disk across processes.
+    module_path : str, optional
+        Directory of templates precompiled with
+        :meth:`jinja2.Environment.compile_templates`; tried before the
+        template sources when provided.
+    template_globals : dict, optional
+        Globals registered once when the environment is first built.
+
+    Returns
+    -------
+    jinja2.Environment
+        Environment shared by all callers with the same arguments.
+    """
+    # Jinja2 environment is built once per template directory and
+    # shared afterwards, so templates are compiled only once
+    key = (package_path, bytecode_cache, module_path)
+    environment = _ENV_CACHE.get(key)
+    if environment is not None:
+        return environment
+
+    import jinja2
+
+    loader = jinja2.FileSystemLoader(package_path)
+    if module_path is not None:
+        # precompiled templates first, falling back to the sources for
+        # anything missing from `module_path`
+        loader = jinja2.ChoiceLoader([
+            jinja2.ModuleLoader(module_path),
+            loader,
+        ])
+
+    environment = jinja2.Environment(
+        # loader=PackageLoader("meshflow", "templates"),
+        loader=loader,
+        # Jinja2 picks a private, per-user temporary directory
+        bytecode_cache=jinja2.FileSystemBytecodeCache(
+            pattern='fiatmodel-%s.cache',
+        ) if bytecode_cache else None,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        line_comment_prefix='##',
+        # shipped templates never change at runtime; skip the
+        # mtime checks and keep every compiled template around
+        auto_reload=False,
+        cache_size=-1,
+    )
+    # referring to the global raise helper function
+    environment.globals['raise'] = raise_helper
+    # software-specific globals are shared by all templates
+    environment.globals.update(template_globals or {})
+    _ENV_CACHE[key] = environment
+
+    return environment
+
+def _current_umask() -> int:
+    """Return the file mode creation mask of the process.
+
+    Returns
+    -------
+    int
+        Current umask; read from ``/proc`` where available, since setting
+        and restoring it with :func:`os.umask` is not thread-safe.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('Umask:'):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
 def raise_helper(msg: str) -> None:
     """Raise an exception inside Jinja2 templates.
 
@@ -76,13 +265,19 @@ class OptimizerTemplateEngine(object):
     Attributes
     ----------
     environment : :class:`jinja2.Environment`
-        Jinja2 environment with filesystem loader for the software template path.
+        Jinja2 environment with filesystem loader for the software template path;
+        shared between all instances targeting the same calibration software.
     calibration_software : str
         Normalized calibration software name (lower-case).
     model : ModelBuilder
         The model adapter associated with this calibration.
     config : dict
         Stored calibration configuration dictionary.
+    template_globals : dict
+        Class-level globals registered once on the shared environment.
+    warn_existing_dirs : bool
+        Class-level flag; when ``True`` (default), :meth:`_create_dir` warns
+        about pre-existing directories.
 
     Methods
     -------
@@ -96,11 +291,39 @@ class OptimizerTemplateEngine(object):
         Generate auxiliary (``etc``) artifacts (abstract).
     generate_obs_templates(output_path)
         Generate observation artifacts (abstract).
+    generate_all(output_path, max_workers=1)
+        Create the instance layout and call all of the above.
     sanity_checks()
         Validate that required model attributes (parameters, constraints) are present.
-    _create_dir(path)
+    _precompile(calibration_software, cache_dir)
+        Internal helper to compile the templates of a calibration software.
+    _dump_group_jsons(base_dir, groups)
+        Internal helper to write one JSON file per group of a mapping.
+    _write_file(path, content, mode=0o666, chmod=False, atomic=False)
+        Internal helper to write a file with a single unbuffered write.
+    _stage_file(src, dst)
+        Internal helper to copy a file, as a reflink where supported.
+    _stage_tree(src, dst)
+        Internal helper to copy a directory tree with :meth:`_stage_file`.
+    _create_dir(path, warn=True)
         Internal helper to create a directory (warns if exists).
     """
+    # fixed set of instance attributes
+    __slots__ = (
+        'environment',
+        'calibration_software',
+        'model',
+        'config',
+    )
+
+    # globals made available to every template of the environment;
+    # subclasses may extend this mapping
+    template_globals: Dict = {}
+    # whether to warn when an output directory already exists
+    warn_existing_dirs: bool = True
+    # directories of an instance, relative to the output path, created
+    # upfront by `generate_all`; subclasses describe their layout here
+    _layout_dirs: Tuple[str, ...] = ()
 
     def __init__(
         self,
@@ -113,7 +336,9 @@ class OptimizerTemplateEngine(object):
         Parameters
         ----------
         config : dict
-            Calibration configuration dictionary.
+            Calibration configuration dictionary. The optional boolean
+            ``bytecode_cache`` entry (default ``True``) controls whether
+            compiled templates are cached on disk across processes.
         calibration_software : str
             Name of the calibration engine to use.
         model : ModelBuilder
@@ -131,47 +356,156 @@ class OptimizerTemplateEngine(object):
         ValueError
             If calibration or model software names are unsupported.
         """
-        package_path = os.path.join(
-            files(__package__),
-            calibration_software,
-            "templates")
-
-        # Jinja2 global environment setup placeholder
-        self.environment = jinja2.Environment(
-            # loader=PackageLoader("meshflow", "templates"),
-            loader=jinja2.FileSystemLoader(package_path),
-            trim_blocks=True,
-            lstrip_blocks=True,
-            line_comment_prefix='##',
-        )
-        # referring to the global raise helper function
-        self.environment.globals['raise'] = raise_helper
-
         # check the `calibration_software` and `model` types and values
         if not isinstance(calibration_software, str):
             raise TypeError('`calibration_software` must be a string')
-        if calibration_software.lower() not in available_calibration_software:
+        if calibration_software.lower() not in _available_calibration_software_set:
             raise ValueError(
                 f"`calibration_software` '{calibration_software}' is not supported."
             )
         self.calibration_software = calibration_software 
 
         # check the `model` type
-        if model.model_software.lower() not in available_model_software.get(self.calibration_software):
+        if model.model_software.lower() not in _available_model_software_sets.get(
+                self.calibration_software, frozenset()):
             raise ValueError(
                 f"`model` software '{model.model_software}' does not match "
                 f"available recipes for {self.calibration_software}."
             )
         self.model = model
 
+        # template directory is resolved once per calibration software
+        package_path = _template_dir(self.calibration_software)
+
+        # compiled templates are persisted on disk unless the user opts out
+        # through the `bytecode_cache` entry of the configuration
+        bytecode_cache = bool((config or {}).get('bytecode_cache', True))
+
+        # Jinja2 environment is shared by all engines of the same
+        # calibration software; precompiled templates are picked up from
+        # `$FIAT_JINJA_CACHE` when available
+        environment = _get_environment(
+            package_path,
+            bytecode_cache=bytecode_cache,
+            module_path=_precompiled_dir(self.calibration_software),
+            template_globals=self.template_globals,
+        )
+        self.environment = environment
+
         # assign all other necessary attributes
         self.config = config
 
         return
 
+    def generate_all(
+        self,
+        output_path: PathLike,
+        max_workers: int = 1,
+    ) -> None:
+        """Generate every artifact of a calibration instance.
+
+        Creates the output directory (warning if it already exists)
+        and all directories of ``_layout_dirs`` upfront, then calls the
+        ``generate_*`` methods.
+
+        Parameters
+        ----------
+        output_path : PathLike
+            Directory where the calibration instance is written.
+        max_workers : int, default ``1``
+            Number of threads used to run the ``generate_*`` methods; they
+            write to separate files, so their (mostly I/O-bound) work can
+            overlap. With ``1``, they run in turn in the calling thread.
+        """
+        # report a pre-existing instance once, and create the rest of
+        # the layout silently; this also keeps the generators from racing
+        # on shared parent directories
+        self._create_dir(output_path)
+        for layout_dir in self._layout_dirs:
+            self._create_dir(os.path.join(output_path, layout_dir), warn=False)
+
+        # `output_path` was just checked, so the optimizer generator must
+        # not report it as pre-existing again
+        generators = (
+            functools.partial(self.generate_optimizer_templates, warn=False),
+            self.generate_parameter_templates,
+            self.generate_etc_templates,
+            self.generate_model_templates,
+            self.generate_obs_templates,
+        )
+
+        if max_workers <= 1:
+            for generator in generators:
+                generator(output_path=output_path)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(generators))
+        ) as executor:
+            futures = [
+                executor.submit(generator, output_path=output_path)
+                for generator in generators
+            ]
+            # propagate the first exception, if any
+            for future in futures:
+                future.result()
+
+        return
+
+    @classmethod
+    def _precompile(
+        cls,
+        calibration_software: str,
+        cache_dir: PathLike,
+    ) -> str:
+        """Precompile the templates of a calibration software.
+
+        Parameters
+        ----------
+        calibration_software : str
+            Name of the calibration engine (e.g., ``"ostrich"``).
+        cache_dir : PathLike
+            Base directory for the compiled templates; they are written to
+            ``<cache_dir>/<version>/<calibration_software>``, ``<version>``
+            being the installed ``fiatmodel`` version.
+
+        Returns
+        -------
+        str
+            Directory containing the compiled template modules.
+
+        Notes
+        -----
+        Point the ``FIAT_JINJA_CACHE`` environment variable to ``cache_dir``
+        so that new engines load the compiled modules instead of lexing and
+        parsing the template sources.
+        """
+        calibration_software = calibration_software.lower()
+        if calibration_software not in _available_calibration_software_set:
+            raise ValueError(
+                f"`calibration_software` '{calibration_software}' is not supported."
+            )
+
+        # compile from the sources, with the very same settings used
+        # at render time
+        environment = _get_environment(
+            _template_dir(calibration_software),
+            bytecode_cache=False,
+            template_globals=cls.template_globals,
+        )
+        module_path = _precompiled_path(cache_dir, calibration_software)
+        environment.compile_templates(
+            target=module_path,
+            zip=None,
+            ignore_errors=False,
+        )
+
+        return module_path
+
     def generate_optimizer_templates(
         self,
         output_path: PathLike,
+        warn: bool = True,
     ) -> None:
         """Generate optimizer configuration artifacts.
 
@@ -179,6 +513,8 @@ class OptimizerTemplateEngine(object):
         ----------
         output_path : PathLike
             Directory where optimizer configuration files should be written.
+        warn : bool, default ``True``
+            Whether to warn if ``output_path`` already exists.
 
         Raises
         ------
@@ -291,24 +627,237 @@ class OptimizerTemplateEngine(object):
         """
         raise NotImplementedError("This method should be implemented by subclasses.")
 
-    def _create_dir(self, path: PathLike) -> None:
+    def _dump_group_jsons(
+        self,
+        base_dir: PathLike,
+        groups: Dict,
+    ) -> None:
+        """Write each group of a mapping to ``<base_dir>/<group>.json``.
+
+        Parameters
+        ----------
+        base_dir : PathLike
+            Existing directory where the JSON files are written.
+        groups : dict
+            Mapping of group names to JSON-serializable objects.
+        """
+        # join the directory once (with a trailing separator) and only
+        # append the file names inside the loop; each document is
+        # serialized in memory and written at once, rather than streamed
+        # token by token through `json.dump`
+        prefix = os.path.join(os.fspath(base_dir), '')
+        payloads = [
+            (f'{prefix}{group}.json', json.dumps(params, indent=4))
+            for group, params in groups.items()
+        ]
+
+        # serialization holds the GIL, but the writes do not; overlap
+        # them when there are several files to write
+        if len(payloads) < 2:
+            for path, content in payloads:
+                self._write_file(path, content)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(payloads))) as executor:
+            # consume the iterator so exceptions are propagated
+            list(executor.map(lambda item: self._write_file(*item), payloads))
+
+        return
+
+    def _write_file(
+        self,
+        path: PathLike,
+        content: Union[str, bytes],
+        mode: int = 0o666,
+        chmod: bool = False,
+        atomic: bool = False,
+    ) -> None:
+        """Write ``content`` to ``path`` with unbuffered binary writes.
+
+        Parameters
+        ----------
+        path : PathLike
+            Destination file; created or truncated.
+        content : str or bytes
+            Data to write; strings are encoded as UTF-8.
+        mode : int, default ``0o666``
+            Permission bits used when the file is created, subject to the
+            process umask (as with :func:`open`).
+        chmod : bool, default ``False``
+            When ``True``, ``mode`` is also applied to an existing file and
+            is not subject to the process umask.
+        atomic : bool, default ``False``
+            When ``True``, write to a uniquely named temporary file next to
+            ``path`` and rename it over ``path``, so readers never observe a
+            partially written file. The replaced file keeps the permission
+            bits of the existing one, unless ``chmod`` is ``True``.
+
+        Notes
+        -----
+        The whole payload is handed to :func:`os.write` at once, which
+        avoids the chunked writes and newline translation of text-mode
+        :func:`open`.
+        """
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        if atomic:
+            # a unique name keeps concurrent writers of the same `path`
+            # from clobbering each other's temporary file
+            head, tail = os.path.split(os.fspath(path))
+            fd, target = tempfile.mkstemp(
+                prefix=f'.{tail}.', suffix='.tmp', dir=head or None)
+            # `mkstemp` creates the file as 0o600; give it the mode of the
+            # file it replaces, or the one `open` would have used
+            if not chmod:
+                try:
+                    mode = stat.S_IMODE(os.stat(path).st_mode)
+                except FileNotFoundError:
+                    mode = mode & ~_current_umask()
+            chmod = True
+        else:
+            target = path
+            fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            # set the permissions on the open descriptor, sparing another
+            # path lookup
+            if chmod:
+                if hasattr(os, 'fchmod'):
+                    os.fchmod(fd, mode)
+                else:
+                    os.chmod(target, mode)
+        except BaseException:
+            os.close(fd)
+            # do not leave a partial temporary file behind
+            if atomic:
+                os.unlink(target)
+            raise
+        os.close(fd)
+
+        # swap the new file in place of the old one
+        if atomic:
+            os.replace(target, path)
+
+        return
+
+    def _stage_file(
+        self,
+        src: PathLike,
+        dst: PathLike,
+    ) -> None:
+        """Stage a copy of ``src`` at ``dst``.
+
+        Parameters
+        ----------
+        src : PathLike
+            Source file.
+        dst : PathLike
+            Destination file; created or truncated.
+
+        Notes
+        -----
+        On Linux, the copy is first attempted as a reflink (``FICLONE``),
+        which shares the data blocks on copy-on-write file systems until
+        either file is modified. Otherwise, or if the file system does not
+        support it, :func:`shutil.copyfile` is used. Hard links are never
+        used, as staged files are rewritten during calibration.
+
+        Raises
+        ------
+        shutil.SameFileError
+            If ``src`` and ``dst`` are the same file; checked before
+            ``dst`` is opened, so that the source is never truncated.
+        """
+        try:
+            same_file = os.path.samefile(src, dst)
+        except OSError:
+            # `dst` does not exist yet
+            same_file = False
+        if same_file:
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+        if _FICLONE is not None:
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                return
+            except OSError:
+                # e.g., different devices or no reflink support
+                pass
+
+        shutil.copyfile(src, dst)
+
+        return
+
+    def _stage_tree(
+        self,
+        src: PathLike,
+        dst: PathLike,
+    ) -> None:
+        """Recursively stage the contents of ``src`` under ``dst``.
+
+        Parameters
+        ----------
+        src : PathLike
+            Source directory.
+        dst : PathLike
+            Destination directory; created if missing, existing files are
+            overwritten.
+
+        Notes
+        -----
+        Equivalent to :func:`shutil.copytree` with ``dirs_exist_ok=True``
+        and symbolic links followed, but walks the tree with
+        :func:`os.scandir` (reusing the cached entry types instead of one
+        ``stat`` per entry) and copies files with :meth:`_stage_file`.
+        """
+        os.makedirs(dst, exist_ok=True)
+        with os.scandir(src) as it:
+            for entry in it:
+                target = os.path.join(dst, entry.name)
+                if entry.is_dir():
+                    self._stage_tree(entry.path, target)
+                else:
+                    self._stage_file(entry.path, target)
+
+        return
+
+    def _create_dir(
+        self,
+        path: PathLike,
+        warn: bool = True,
+    ) -> None:
         """Create a directory, warning if it already exists.
 
         Parameters
         ----------
         path : PathLike
             Target directory path to create.
+        warn : bool, default ``True``
+            Whether to warn about a pre-existing directory; set to ``False``
+            for sub-directories of a directory that was already checked.
 
         Notes
         -----
-        Uses :func:`os.makedirs` with ``exist_ok=True`` and issues a
-        :class:`UserWarning` if the path already exists.
+        Uses :func:`os.makedirs` and issues a :class:`UserWarning` if the
+        path already exists and both ``warn`` and ``warn_existing_dirs``
+        are ``True``. The existence check relies on :class:`FileExistsError`
+        rather than a separate ``stat`` call.
         """
-        # if `path` exists, give a warning and create the path nonetheless
-        if os.path.exists(path):
+        # nothing to report, let `os.makedirs` handle existing directories
+        if not (warn and self.warn_existing_dirs):
+            os.makedirs(path, exist_ok=True)
+            return
+
+        # create the directory; if `path` exists, give a warning and
+        # continue nonetheless
+        try:
+            os.makedirs(path)
+        except FileExistsError:
+            if not os.path.isdir(path):
+                raise
             warnings.warn(f"The directory {path} already exists."
                           " Contents may be overwritten.", UserWarning)
-        # create the directory
-        os.makedirs(path, exist_ok=True)
 
         return
@@ -6,9 +6,12 @@ lowercase normalized variants commonly found in literature or user inputs.
 
 Attributes
 ----------
-_algorithm_equivalents : dict[str, str]
-    Mapping from a normalized algorithm name to the canonical Ostrich
-    identifier used in templates and configuration files.
+_algorithm_equivalents : Mapping[str, str]
+    Read-only mapping from a normalized algorithm name to the canonical
+    Ostrich identifier used in templates and configuration files.
+template_namespace : Mapping[str, object]
+    Read-only mapping of the names made available to the Ostrich templates
+    as ``default_dicts``.
 
 Examples
 --------
@@ -16,9 +19,14 @@ Examples
 'LevMar'
 >>> _algorithm_equivalents.get('geneticalgorithm')
 'GeneticAlg'
+>>> resolve_algorithm('GeneticAlgorithm')
+'GeneticAlg'
 """
+# built-in imports
+from types import MappingProxyType
+from typing import Optional
 
-_algorithm_equivalents = {
+_algorithm_equivalents = MappingProxyType({
     'bisectionalgorithm': 'BisectionAlg',
     'fletcher-reeves': 'FletchReevesAlg',
     'levenberg-marquardt': 'LevMar',
@@ -46,4 +54,29 @@ _algorithm_equivalents = {
     'padds': 'PADDSAlg',
     'parapadds': 'ParallelPADDSAlg',
     'smooth': 'SMOOTH',
-}
\ No newline at end of file
+})
+
+def resolve_algorithm(name: Optional[str]) -> Optional[str]:
+    """Translate a user-provided algorithm name to its Ostrich identifier.
+
+    Parameters
+    ----------
+    name : str or None
+        Algorithm name in any case.
+
+    Returns
+    -------
+    str or None
+        Canonical Ostrich identifier, or ``None`` if ``name`` is ``None``
+        or not recognized.
+    """
+    if name is None:
+        return None
+    return _algorithm_equivalents.get(name.lower())
+
+# read-only namespace exposed to the Ostrich templates as `default_dicts`;
+# Jinja2 resolves `default_dicts.<name>` through item lookup on it
+template_namespace = MappingProxyType({
+    'algorithm_equivalents': _algorithm_equivalents,
+    'resolve_algorithm': resolve_algorithm,
+})
@@ -14,17 +14,21 @@ Notes
 - Paths are treated as path-like objects (``str`` or :class:`pathlib.Path`).
 """
 # built-in imports
-import sys
-import shutil
 import os
-import json
+import functools
+import hashlib
+import pickle
 
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Dict,
     Union,
     Optional,
     Sequence,
     List,
+    Tuple,
+    TypeAlias,
 )
 from pathlib import Path
 
@@ -34,11 +38,7 @@ from . import default_dicts as DEFAULT_DICTS
 
 # defining custom types
 # PathLike type alias
-if sys.version_info >= (3, 10):
-    from typing import TypeAlias
-    PathLike: TypeAlias = Union[str, Path]
-else:
-    PathLike = Union[str, Path]
+PathLike: TypeAlias = Union[str, Path]
 # JsonType type alias
 JSON: TypeAlias = dict[str, "JSON"] | list["JSON"] | str | int | float | bool | None
 
@@ -65,6 +65,8 @@ class OstrichTemplateEngine(OptimizerTemplateEngine):
 
     Methods
     -------
+    precompile(cache_dir)
+        Compile the Ostrich templates ahead of time into ``cache_dir``.
     generate_optimizer_templates(output_path, return_text=False)
         Render and write the optimizer input file (e.g., ``ostIn.txt``).
     generate_parameter_templates(output_path, return_templates=False)
@@ -76,6 +78,36 @@ class OstrichTemplateEngine(OptimizerTemplateEngine):
     generate_obs_templates(output_path)
         Create the ``observations/`` directory used by calibration runs.
     """
+    # instance attributes in addition to the base class ones
+    __slots__ = (
+        'template',
+        'archive_template',
+        '_last_render_key',
+        '_last_render_content',
+    )
+
+    # global dictionaries for templating, registered once on the shared
+    # environment as a frozen mapping
+    template_globals = {
+        'default_dicts': DEFAULT_DICTS.template_namespace,
+    }
+
+    # layout of an Ostrich instance, relative to `output_path`
+    _OPTIMIZER_FILE = 'ostIn.txt'
+    _ETC_DIR = 'etc'
+    _ETC_SCRIPTS_DIR = os.path.join(_ETC_DIR, 'scripts')
+    _ETC_EVAL_DIR = os.path.join(_ETC_DIR, 'eval')
+    _ETC_TEMPLATES_DIR = os.path.join(_ETC_DIR, 'templates')
+    _ARCHIVE_SCRIPT = os.path.join(_ETC_SCRIPTS_DIR, 'archive.sh')
+    _MODEL_DIR = 'model'
+    _OBS_DIR = 'observations'
+    _layout_dirs = (
+        _ETC_SCRIPTS_DIR,
+        _ETC_EVAL_DIR,
+        _ETC_TEMPLATES_DIR,
+        _MODEL_DIR,
+        _OBS_DIR,
+    )
 
     def __init__(
         self,
@@ -109,20 +141,97 @@ class OstrichTemplateEngine(OptimizerTemplateEngine):
             calibration_software='ostrich',
             model=model,
         )
-        # setting the jinja2 file template
-        self.template = self.environment.get_template(
-            self.model.model_software.lower() + '.jinja2')
-        self.archive_template = self.environment.get_template(
-            'archive.jinja2')
-        # assigning global dictionaries for templating
-        self.template.globals["default_dicts"] = DEFAULT_DICTS
+        # setting the jinja2 file templates, shared by all instances
+        # using the same environment and model software
+        self.template, self.archive_template = self._get_templates(
+            self.environment,
+            self.model.model_software.lower(),
+        )
+        # digest of the last rendered `info` and its rendered content
+        self._last_render_key = None
+        self._last_render_content = None
 
         return
 
+    @classmethod
+    def precompile(
+        cls,
+        cache_dir: PathLike,
+    ) -> str:
+        """Precompile the Ostrich templates into ``cache_dir``.
+
+        Parameters
+        ----------
+        cache_dir : PathLike
+            Base directory for the compiled templates. Set the
+            ``FIAT_JINJA_CACHE`` environment variable to this directory to
+            use them in later runs.
+
+        Returns
+        -------
+        str
+            Directory containing the compiled template modules.
+        """
+        return cls._precompile('ostrich', cache_dir)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_templates(
+        cls,
+        environment: 'jinja2.Environment',  # type: ignore
+        model_software: str,
+    ) -> Tuple:
+        """Look up the compiled templates for a model software.
+
+        Parameters
+        ----------
+        environment : :class:`jinja2.Environment`
+            Environment to load the templates from.
+        model_software : str
+            Lower-case model software name (e.g., ``"mesh"``).
+
+        Returns
+        -------
+        tuple
+            ``(template, archive_template)`` compiled Jinja2 templates.
+        """
+        return (
+            environment.get_template(model_software + '.jinja2'),
+            environment.get_template('archive.jinja2'),
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _render_archive(
+        cls,
+        environment: 'jinja2.Environment',  # type: ignore
+        model_software: str,
+    ) -> str:
+        """Render the ``archive.sh`` script for a model software.
+
+        The script only depends on ``model_software``, so it is rendered
+        once per process and reused afterwards.
+
+        Parameters
+        ----------
+        environment : :class:`jinja2.Environment`
+            Environment to load the archive template from.
+        model_software : str
+            Lower-case model software name (e.g., ``"mesh"``).
+
+        Returns
+        -------
+        str
+            Rendered content of ``archive.sh``.
+        """
+        _, archive_template = cls._get_templates(environment, model_software)
+        return archive_template.render(model=model_software)
+
     def generate_optimizer_templates(
         self,
         output_path: PathLike,
         return_text: bool = False,
+        warn: bool = True,
     ):
         """Render the optimizer input file (e.g., ``ostIn.txt``).
 
@@ -132,32 +241,59 @@ class OstrichTemplateEngine(OptimizerTemplateEngine):
             Directory where the optimizer input will be written.
         return_text : bool, default ``False``
             When ``True``, return the rendered text instead of only writing it.
+        warn : bool, default ``True``
+            Whether to warn if ``output_path`` already exists; ``generate_all``
+            checks it itself beforehand.
 
         Returns
         -------
         str or None
             Rendered content if ``return_text`` is ``True``; otherwise ``None``.
         """
-        self.template.globals["default_dicts"] = DEFAULT_DICTS
-
         # combining model information with the current config and supplying
-        # the template with all necessary information
-        info_dict = self.config.copy()
-        # adding model 1) `parameters`, 2) `parameter_bounds`, and 
-        # 3) `parameter_constraints`
-        info_dict['parameters'] = self.model.templated_parameters
-        info_dict['parameter_bounds'] = self.model.parameter_bounds
-        info_dict['parameter_constraints'] = self.model.parameter_constraints
-
-        # create content
-        content = self.template.render(
-            info=info_dict,
+        # the template with all necessary information; the model entries
+        # 1) `parameters`, 2) `parameter_bounds`, and 3) `parameter_constraints`
+        # are overlaid on the config without copying it
+        model = self.model
+        info_dict = ChainMap(
+            {
+                'parameters': model.templated_parameters,
+                'parameter_bounds': model.parameter_bounds,
+                'parameter_constraints': model.parameter_constraints,
+            },
+            self.config,
         )
 
-        # save the `content` to the `output_path`
-        self._create_dir(output_path) # assure it exists
-        with open(os.path.join(output_path, 'ostIn.txt'), 'w') as f:
-            f.write(content)
+        # create content, unless `info` is identical to the one of the
+        # previous call; the comparison uses a digest of its pickled form
+        # and is skipped if any value cannot be pickled
+        try:
+            render_key = hashlib.blake2b(
+                pickle.dumps(dict(info_dict), protocol=pickle.HIGHEST_PROTOCOL),
+                digest_size=16,
+            ).digest()
+        except (pickle.PicklingError, TypeError, AttributeError):
+            render_key = None
+
+        if render_key is not None and render_key == self._last_render_key:
+            content = self._last_render_content
+        else:
+            content = self.template.render(
+                info=info_dict,
+            )
+            self._last_render_key = render_key
+            self._last_render_content = content
+
+        # save the `content` to the `output_path`; this is the only place
+        # an existing output tree is reported, the directories below it
+        # are created silently by the other `generate_*` methods
+        self._create_dir(output_path, warn=warn) # assure it exists
+        # replaced atomically, as Ostrich workers may be reading it
+        self._write_file(
+            os.path.join(output_path, self._OPTIMIZER_FILE),
+            content,
+            atomic=True,
+        )
 
         # check to see if it is necessary to return the text
         if return_text:
@@ -190,30 +326,16 @@ class OstrichTemplateEngine(OptimizerTemplateEngine):
         # within the `model` instance. The values need
         # to be printed into `$OUTPUT_PATH/etc/templates/`
         # directory for OSTRICH to use them.
-        for group, params in self.model.templated_parameters.items():
-            # create directory for each parameter group
-            group_path = os.path.join(
-                output_path,
-                'etc',
-                'templates',
-            )
-            self._create_dir(group_path)
-
-            # dump JSON files for each parameter group
-            with open(
-                os.path.join(
-                    group_path,
-                    f'{group}.json',
-                ),
-                'w',
-            ) as f:
-                json_obj = json.dumps(params, indent=4)
-                f.write(json_obj)
-
-            if return_templates:
-                objects.append(params)
+        # all parameter groups share the same directory
+        group_path = os.path.join(output_path, self._ETC_TEMPLATES_DIR)
+        self._create_dir(group_path, warn=False)
+
+        # dump JSON files for each parameter group
+        templated_parameters = self.model.templated_parameters
+        self._dump_group_jsons(group_path, templated_parameters)
 
         if return_templates:
+            objects.extend(templated_parameters.values())
             return objects
 
         return
@@ -233,48 +355,33 @@ class OstrichTemplateEngine(OptimizerTemplateEngine):
         output_path : PathLike
             Base output directory where ``etc`` will be created.
         """
-        # create the `etc` directory
-        etc_path = os.path.join(
-            output_path,
-            'etc',
-        )
-        self._create_dir(etc_path)
-
-        # creating `scripts` and `eval` directories within `etc`
-        other_dirs = ['scripts', 'eval', 'templates']
-        for other_dir in other_dirs:
-            self._create_dir(os.path.join(etc_path, other_dir))
+        # create the `etc` directory along with its `scripts`, `eval`, and
+        # `templates` sub-directories
+        for sub_dir in (self._ETC_SCRIPTS_DIR, self._ETC_EVAL_DIR, self._ETC_TEMPLATES_DIR):
+            self._create_dir(os.path.join(output_path, sub_dir), warn=False)
 
         # create an archiving script
-        archive_script_path = os.path.join(
-            etc_path,
-            'scripts',
-            'archive.sh',
-        )
-
-        archive_content = self.archive_template.render(
-            model=self.model.model_software.lower())
-        with open(archive_script_path, 'w') as f:
-            f.write(archive_content)
+        archive_script_path = os.path.join(output_path, self._ARCHIVE_SCRIPT)
 
+        archive_content = self._render_archive(
+            self.environment,
+            self.model.model_software.lower(),
+        )
         # make sure the script is executable
-        os.chmod(archive_script_path, 0o755)
+        self._write_file(
+            archive_script_path,
+            archive_content,
+            mode=0o755,
+            chmod=True,
+        )
 
         # if `others` attribute is populated (not an empty dictionary)
         if len(self.model.others) > 0:
-            for group, params in self.model.others.items():
-                # dump JSON files for each parameter group
-                with open(
-                    os.path.join(
-                        output_path,
-                        'etc',
-                        'templates',
-                        f'{group}.json',
-                    ),
-                    'w',
-                ) as f:
-                    json_obj = json.dumps(params, indent=4)
-                    f.write(json_obj)
+            # dump JSON files for each group next to the parameter templates
+            self._dump_group_jsons(
+                os.path.join(output_path, self._ETC_TEMPLATES_DIR),
+                self.model.others,
+            )
 
         return
 
@@ -294,29 +401,38 @@ class OstrichTemplateEngine(OptimizerTemplateEngine):
             Base output directory where the ``model`` directory will be created.
         """
         # copy the required files to `output_path/model/`
-        model_output_path = os.path.join(
-            output_path,
-            'model',
-        )
-        self._create_dir(model_output_path)
+        model_output_path = os.path.join(output_path, self._MODEL_DIR)
+        self._create_dir(model_output_path, warn=False)
 
         # copying required files---note that forcing files are not copied
         # and are not included in `self.mode.required_files` object on
-        # purpose
+        # purpose; only the contents are needed, so files are reflinked
+        # where possible and copied otherwise, without permission bits.
+        # Hard links are avoided on purpose, as the staged files are
+        # rewritten during calibration and must not share their inode
+        # with the original model instance.
         for file in self.model.required_files:
-            shutil.copy(
+            self._stage_file(
                 os.path.join(self.model.config['instance_path'], file),
-                model_output_path,
+                os.path.join(model_output_path, os.path.basename(file)),
             )
 
-        # if there are required directories, copy them as well
-        for dir in self.model.required_dirs:
-            shutil.copytree(
+        # if there are required directories, copy them as well; the
+        # directories are independent, so they are copied concurrently
+        # to overlap the (I/O-bound) copies
+        def _copy_dir(dir: str) -> None:
+            self._stage_tree(
                 os.path.join(self.model.config['instance_path'], dir),
                 os.path.join(model_output_path, dir),
-                dirs_exist_ok=True,
             )
 
+        if self.model.required_dirs:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(self.model.required_dirs))
+            ) as executor:
+                # consume the iterator so exceptions are propagated
+                list(executor.map(_copy_dir, self.model.required_dirs))
+
         return
 
     def generate_obs_templates(
@@ -331,10 +447,7 @@ class OstrichTemplateEngine(OptimizerTemplateEngine):
             Base output directory under which ``observations`` will be created.
         """
         # create the `etc/observations/` directory
-        obs_path = os.path.join(
-            output_path,
-            'observations',
-        )
-        self._create_dir(obs_path)
+        obs_path = os.path.join(output_path, self._OBS_DIR)
+        self._create_dir(obs_path, warn=False)
 
         return
\ No newline at end of file
@@ -2,60 +2,311 @@
 
 # 3rd-party imports
 import pandas as pd
-import xarray as xr
 import numpy as np
 
-import pint
-import pint_xarray  # noqa: F401  # registers the .pint accessor
-
 # build-in imports
+import functools
 import json
-import sys
 import os
-import re
 import shutil
 
+from importlib import import_module
 from importlib.resources import (
     files,
     as_file
 )
 from typing import (
+    TYPE_CHECKING,
+    Callable,
     Dict,
     List,
+    Tuple,
     Union,
+    TypeAlias,
 )
 from pathlib import Path
 
 # internal imports
 from .utils import *
 
+# xarray (and Pint, see `_get_ureg`) is only needed once observations
+# are processed, and is imported there
+if TYPE_CHECKING:
+    import pint
+    import xarray as xr
+
 # defining custom types
-if sys.version_info >= (3, 10):
-    from typing import TypeAlias
-    PathLike: TypeAlias = Union[str, Path]
-else:
-    PathLike = Union[str, Path]
+PathLike: TypeAlias = Union[str, Path]
 
 # defining global constants
-# Pint registry
-ureg = pint.UnitRegistry()
-# This line fixes: ValueError: invalid registry. Please enable 'force_ndarray_like' or 'force_ndarray'.
-ureg.force_ndarray_like = True  # or: ureg.force_ndarray = True (stricter)
-pint.set_application_registry(ureg)
-# global re patterns for numeric string parsing:
-#   Precompile regexes for speed/readability
-_INT_RE = re.compile(r'^[-+]?\d+$')
-_FLOAT_RE = re.compile(
-    r"""^[-+]?(                # optional sign
-        (?:\d+\.\d*|\d*\.\d+)  # something with a decimal point
-        (?:[eE][-+]?\d+)?      # optional exponent
-        |
-        \d+[eE][-+]?\d+        # or integer with exponent (e.g. 1e6)
-    )$""",
-    re.X
-)
-# current enviornment
-MYENV = os.environ.copy()
+# Pint registry and a copy of the current environment; both are built on
+# first use (see `_get_ureg` and `_get_env`), as importing Pint and loading
+# the unit definitions is slow and only needed when observations are
+# processed.
+# `ureg` and `MYENV` remain available as module attributes through the
+# module-level `__getattr__`
+_UREG = None
+_MYENV = None
+# supported model and calibration software, mapped to the module and class
+# implementing them; the modules are imported on first use only
+_MODEL_SOFTWARE: Dict[str, tuple] = {
+    'mesh': ('.models.mesh', 'MESH'),
+}
+_CALIBRATION_SOFTWARE: Dict[str, tuple] = {
+    'ostrich': ('.calibration', 'OstrichTemplateEngine'),
+}
+# floating-point types the observation matrices can be stored in
+_OBS_PRECISIONS = ('f4', 'f8')
+# workflow packages used by the evaluation scripts of each model software
+_MODEL_WORKFLOWS: Dict[str, str] = {
+    'mesh': 'meshflow',
+}
+# NetCDF chunk shape of the observation variables: time steps, and
+# elements along the other dimensions; the Dask-backed observations are
+# chunked by rows accordingly
+_NC_CHUNK_TIME = 4096
+_NC_CHUNK_ROWS = 64
+# classes resolved from the mappings above
+_FACTORIES: Dict[tuple, Callable] = {}
+
+
+def _get_ureg() -> 'pint.UnitRegistry':
+    """Return the module's Pint unit registry, building it on first use.
+
+    Pint and pint-xarray (which registers the ``.pint`` accessor on xarray
+    objects) are imported along with it.
+
+    Returns
+    -------
+    pint.UnitRegistry
+        Registry shared by the package and set as Pint's application
+        registry.
+    """
+    global _UREG
+    if _UREG is None:
+        import pint
+        import pint_xarray  # noqa: F401  # registers the .pint accessor
+
+        ureg = pint.UnitRegistry()
+        # This line fixes: ValueError: invalid registry. Please enable 'force_ndarray_like' or 'force_ndarray'.
+        ureg.force_ndarray_like = True  # or: ureg.force_ndarray = True (stricter)
+        pint.set_application_registry(ureg)
+        _UREG = ureg
+    return _UREG
+
+
+def _get_env() -> Dict[str, str]:
+    """Return a copy of the environment, taken on first use.
+
+    Returns
+    -------
+    dict
+        Copy of :data:`os.environ` at the time of the first call.
+    """
+    global _MYENV
+    if _MYENV is None:
+        _MYENV = os.environ.copy()
+    return _MYENV
+
+
+def __getattr__(name: str):
+    """Resolve the lazily built module globals ``ureg`` and ``MYENV``."""
+    if name == 'ureg':
+        return _get_ureg()
+    if name == 'MYENV':
+        return _get_env()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _fill_rows(
+    n_rows: int,
+    n_time: int,
+    parts: List[tuple],
+    dtype: np.dtype = np.float64,
+) -> np.ndarray:
+    """Assemble the observations of a block of computational units.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of computational units (rows) in the block.
+    n_time : int
+        Length of the global time axis.
+    parts : list of tuple
+        ``(row, columns, values)`` parts to scatter into the block, with
+        ``row`` relative to the first row of the block.
+    dtype : numpy.dtype, default ``numpy.float64``
+        Floating-point type of the block.
+
+    Returns
+    -------
+    numpy.ndarray
+        Block of shape ``(n_rows, n_time)``; ``NaN`` where nothing is
+        observed.
+    """
+    out = np.full((n_rows, n_time), np.nan, dtype=dtype)
+    for row, pos, vals in parts:
+        out[row, pos] = vals
+    return out
+
+
+def _lazy_matrix(
+    parts: List[tuple],
+    n_cu: int,
+    n_time: int,
+    dtype: np.dtype = np.float64,
+):
+    """Build a Dask-backed (computational unit, time) matrix.
+
+    Parameters
+    ----------
+    parts : list of tuple
+        ``(row, columns, values)`` parts of one observation type.
+    n_cu : int
+        Number of computational units (rows).
+    n_time : int
+        Length of the global time axis (columns).
+    dtype : numpy.dtype, default ``numpy.float64``
+        Floating-point type of the matrix.
+
+    Returns
+    -------
+    dask.array.Array
+        Matrix with one chunk per ``_NC_CHUNK_ROWS`` rows, each filled by
+        :func:`_fill_rows`; the chunks line up with the NetCDF chunks of
+        :func:`_netcdf_encoding`, so each of those is written in one go.
+    """
+    import dask
+    import dask.array as da
+
+    if n_cu == 0:
+        return da.full((0, n_time), np.nan, dtype=dtype)
+
+    parts_by_block: Dict[int, List[tuple]] = {}
+    for row, pos, vals in parts:
+        block, block_row = divmod(row, _NC_CHUNK_ROWS)
+        parts_by_block.setdefault(block, []).append((block_row, pos, vals))
+
+    blocks = []
+    for block, start in enumerate(range(0, n_cu, _NC_CHUNK_ROWS)):
+        n_rows = min(_NC_CHUNK_ROWS, n_cu - start)
+        if block in parts_by_block:
+            blocks.append(da.from_delayed(
+                dask.delayed(_fill_rows)(
+                    n_rows, n_time, parts_by_block[block], dtype),
+                shape=(n_rows, n_time),
+                dtype=dtype,
+            ))
+        else:
+            # nothing observed for this type
+            blocks.append(da.full(
+                (n_rows, n_time), np.nan, dtype=dtype,
+                chunks=(n_rows, n_time),
+            ))
+
+    return da.concatenate(blocks, axis=0)
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_conversion(
+    from_unit: str,
+    to_unit: str,
+) -> Tuple[float, float]:
+    """Return the affine transform converting ``from_unit`` to ``to_unit``.
+
+    Pint is queried once per unit pair; as the pairs repeat across entries
+    and calls, values are then converted with plain NumPy arithmetic.
+
+    Parameters
+    ----------
+    from_unit : str
+        Unit of the values to convert.
+    to_unit : str
+        Target unit.
+
+    Returns
+    -------
+    tuple of float
+        ``(scale, offset)`` such that ``values * scale + offset`` are in
+        ``to_unit``; the offset is non-zero for offset units (e.g., degC
+        to K).
+    """
+    ureg = _get_ureg()
+    offset = float(ureg.Quantity(0.0, from_unit).to(to_unit).magnitude)
+    scale = float(ureg.Quantity(1.0, from_unit).to(to_unit).magnitude) - offset
+    return scale, offset
+
+
+def _netcdf_encoding(
+    ds: 'xr.Dataset',
+) -> Dict[str, Dict]:
+    """Build a compressed, chunked NetCDF encoding for observations.
+
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        Observations dataset to be written with
+        :meth:`xarray.Dataset.to_netcdf`.
+
+    Returns
+    -------
+    dict
+        Encoding of every floating-point data variable: zlib compression
+        (level 4) and chunks of up to 4096 time steps by 64 elements along
+        the other dimensions.
+    """
+    encoding = {}
+    for name, var in ds.data_vars.items():
+        if not np.issubdtype(var.dtype, np.floating):
+            continue
+        enc = {"zlib": True, "complevel": 4}
+        # chunk sizes must be positive, leave empty variables as is
+        if var.ndim > 0 and all(var.shape):
+            enc["chunksizes"] = tuple(
+                min(_NC_CHUNK_TIME if dim == "time" else _NC_CHUNK_ROWS, size)
+                for dim, size in zip(var.dims, var.shape)
+            )
+        encoding[name] = enc
+    return encoding
+
+
+def _get_factory(
+    kind: str,
+    software: str,
+) -> Callable:
+    """Resolve the class implementing a model or calibration software.
+
+    Parameters
+    ----------
+    kind : {'model', 'calibration'}
+        Which registry to look ``software`` up in.
+    software : str
+        Lower-case software name (e.g., ``"mesh"`` or ``"ostrich"``).
+
+    Returns
+    -------
+    Callable
+        The implementing class; its module is imported on the first call
+        and the class is reused afterwards.
+
+    Raises
+    ------
+    ValueError
+        If ``software`` is not supported.
+    """
+    factory = _FACTORIES.get((kind, software))
+    if factory is not None:
+        return factory
+
+    registry = _MODEL_SOFTWARE if kind == 'model' else _CALIBRATION_SOFTWARE
+    if software not in registry:
+        raise ValueError(f"Unsupported {kind} software: {software}")
+
+    module_name, class_name = registry[software]
+    factory = getattr(import_module(module_name, __package__), class_name)
+    _FACTORIES[(kind, software)] = factory
+
+    return factory
 
 
 class Calibration(object):
@@ -83,6 +334,8 @@ class Calibration(object):
         Configuration dictionary used by the calibration engine.
     model_config : dict or None
         Configuration dictionary used by the model.
+    precision : {'f4', 'f8'}
+        Floating-point precision of the observation matrices.
     model : object
         Model adapter instance constructed from ``model_software`` (e.g.,
         ``fiatmodel.models.mesh.MESH``).
@@ -91,10 +344,20 @@ class Calibration(object):
         (e.g., ``fiatmodel.calibration.OstrichTemplateEngine``).
     observations : xarray.Dataset
         Property that builds and returns the observations dataset on access.
+    observations_quantified : xarray.Dataset
+        Property returning the observations dataset quantified with Pint.
+    observations_lazy : xarray.Dataset
+        Property returning the observations dataset backed by Dask arrays.
     _obs : list of dict or pandas.Series or pathlib.Path or str
         Raw observation definitions, a time series, or a path to a NetCDF
         file provided by the user. Used internally by the ``observations``
         property. (Private)
+    _obs_cache : xarray.Dataset or None
+        Dataset built by the ``observations`` property on first access;
+        reset whenever new observations are assigned. (Private)
+    _obs_cache_key : int or None
+        Identity of the ``_obs`` object ``_obs_cache`` was built from.
+        (Private)
 
     Methods
     -------
@@ -126,6 +389,7 @@ class Calibration(object):
         calibration_config: Dict = None,
         model_config: Dict = None,
         observations: List[Dict] = None,
+        precision: str = 'f8',
     ) -> None:
         """Create a new `Calibration` controller.
 
@@ -143,6 +407,12 @@ class Calibration(object):
         observations : list of dict, optional
             Observation definitions used for evaluation. See
             the ``observations`` property for the expected schema.
+        precision : {'f4', 'f8'}, default ``'f8'``
+            Floating-point precision of the observation matrices. Single
+            precision (``'f4'``) halves the memory use and file size, and is
+            usually ample for hydrologic observations; values are rounded
+            to about 7 significant digits, and magnitudes beyond the
+            ``float32`` range become infinite.
 
         Notes
         -----
@@ -154,44 +424,47 @@ class Calibration(object):
             raise TypeError('`calibration_software` must be a string')
         if not isinstance(model_software, str):
             raise TypeError('`model_software` must be a string')
-        if calibration_config is not None and not isinstance(calibration_config, dict):
+        if not isinstance(calibration_config, (dict, type(None))):
             raise TypeError('`calibration_config` must be a dictionary')
-        if model_config is not None and not isinstance(model_config, dict):
+        if not isinstance(model_config, (dict, type(None))):
             raise TypeError('`model_config` must be a dictionary')
-        if observations is not None and not isinstance(observations, list):
+        if not isinstance(observations, (list, type(None))):
             raise TypeError('`observations` must be a list of dictionaries')
+        if not isinstance(precision, str):
+            raise TypeError('`precision` must be a string')
+
+        if precision not in _OBS_PRECISIONS:
+            raise ValueError(
+                f"Unsupported precision: {precision}. "
+                f"Available options are: {list(_OBS_PRECISIONS)}"
+            )
 
         # assign object attributes
         self.calibration_software = calibration_software.lower()
         self.model_software = model_software.lower()
         self.calibration_config = calibration_config
         self.model_config = model_config
+        self.precision = precision
         self._obs = observations
+        # built observations dataset and the identity of the inputs it was
+        # built from, see the `observations` property
+        self._obs_cache = None
+        self._obs_cache_key = None
 
         # build the model-specific object
-        match self.model_software:
-            case 'mesh':
-                from .models.mesh import MESH
-                self.model = MESH(
-                    config=self.model_config,
-                    calibration_software=self.calibration_software,
-                    fluxes=self.calibration_config.get('objective_functions').keys(),
-                    dates=self.calibration_config.get('dates'),
-                    spinup=self.calibration_config.get('spinup_start'),
-                )
-            case _:
-                raise ValueError(f"Unsupported model software: {self.model_software}")
+        self.model = _get_factory('model', self.model_software)(
+            config=self.model_config,
+            calibration_software=self.calibration_software,
+            fluxes=self.calibration_config.get('objective_functions').keys(),
+            dates=self.calibration_config.get('dates'),
+            spinup=self.calibration_config.get('spinup_start'),
+        )
 
         # build the calibration-specific object
-        match self.calibration_software:
-            case 'ostrich':
-                from .calibration import OstrichTemplateEngine
-                self.calibration = OstrichTemplateEngine(
-                    config=self.calibration_config,
-                    model=self.model,
-                )
-            case _:
-                raise ValueError(f"Unsupported calibration software: {self.calibration_software}")
+        self.calibration = _get_factory('calibration', self.calibration_software)(
+            config=self.calibration_config,
+            model=self.model,
+        )
 
         return
 
@@ -254,16 +527,15 @@ class Calibration(object):
     @property
     def observations(
         self,
-    ) -> xr.Dataset:
+    ) -> 'xr.Dataset':
         """
-        Load and process observational data into a quantified xarray.Dataset.
+        Load and process observational data into an xarray.Dataset.
 
         This method consumes observational data provided either as:
         1) a path to a NetCDF file (.nc or .nc4), or
         2) a list of entry sequences describing time series per computational unit.
 
-        When provided a NetCDF file path, the dataset is opened and quantified using the
-        module's Pint unit registry. If a "freq" variable must be present to assure
+        When provided a NetCDF file path, the dataset is opened as is. If a "freq" variable must be present to assure
         the frequency information is interpretted properly. Due to natue of observational
         data, missing timestamps are common, therefore, no inference of frequency
         is performed and the user must provide it explicitly.
@@ -343,115 +615,230 @@ class Calibration(object):
         -------
         xarray.Dataset
             Observations as an xarray dataset with time and computational
-            unit dimensions; variables carry units via the Pint accessor.
+            unit dimensions; variables carry their units in the ``units``
+            attribute. See ``observations_quantified`` for a Pint-quantified
+            dataset.
+
+        """
+        # the dataset is built once and reused until new observations
+        # are assigned through the setter
+        if self._obs_cache is not None and self._obs_cache_key == id(self._obs):
+            return self._obs_cache
+
+        self._obs_cache = self._build_observations(lazy=False)
+        self._obs_cache_key = id(self._obs)
+        return self._obs_cache
+
+    @observations.setter
+    def observations(self, value: List[Dict] | pd.Series) -> None:
+        """Set observational inputs.
+
+        Parameters
+        ----------
+        value : list of dict or pandas.Series
+            Observation definitions or a pre-built series that will be parsed
+            into an internal xarray dataset by the getter.
+        """
+        if not isinstance(value, list | pd.Series):
+            raise TypeError("`observations` must be a list of dictionaries or a pandas Series.")
+        self._obs = value
+        # invalidate the dataset built from the previous observations
+        self._obs_cache = None
+        self._obs_cache_key = None
+        return
+
+    @property
+    def observations_lazy(
+        self,
+    ) -> 'xr.Dataset':
+        """Observations dataset backed by Dask arrays.
+
+        Same content as ``observations``, but the (computational unit,
+        time) matrices are not materialized: each block of up to 64
+        computational units is a separate Dask chunk filled on compute,
+        matching the NetCDF chunks of ``observations.nc``. Writing the
+        result with :meth:`xarray.Dataset.to_netcdf` then proceeds chunk by
+        chunk, keeping the peak memory use bounded for large observation
+        sets.
+
+        Returns
+        -------
+        xarray.Dataset
+            Dask-backed observations dataset; built anew on every access.
+        """
+        return self._build_observations(lazy=True)
+
+    def _build_observations(
+        self,
+        lazy: bool = False,
+    ) -> 'xr.Dataset':
+        """Build the observations dataset from the user inputs.
 
+        Parameters
+        ----------
+        lazy : bool, default ``False``
+            Whether to back the data variables with Dask arrays rather than
+            in-memory NumPy arrays.
+
+        Returns
+        -------
+        xarray.Dataset
+            Observations dataset; see the ``observations`` property.
         """
+        import xarray as xr
+
         # by default, enable converting units
         convert_units: bool = True
+        # floating-point type of the observation matrices
+        dtype = np.dtype(self.precision)
 
         # if the `observation` is a netcdf file path, read it directly
         if isinstance(self._obs, PathLike):
-            # make sure it is a `Path` object
-            self._obs = Path(self._obs)
+            # make sure it is a `Path` object; `self._obs` itself is left
+            # untouched, as its identity keys the cached dataset
+            obs_path = Path(self._obs)
             # extract the suffix
-            if self._obs.suffix in ['.nc', '.nc4']:
-                dsq = xr.open_dataset(self._obs).pint.quantify(unit_registry=ureg)
+            if obs_path.suffix in ['.nc', '.nc4']:
+                # Dask-backed variables when a lazy dataset is requested
+                ds = xr.open_dataset(obs_path, chunks={} if lazy else None)
                 # extract the frequency information from the time coordinate
                 # if not provided already as variable
-                if "freq" not in dsq.variables:
-                    time_index = pd.DatetimeIndex(dsq["time"].values)
+                if "freq" not in ds.variables:
+                    time_index = pd.DatetimeIndex(ds["time"].values)
                     inferred_freq = pd.infer_freq(time_index)
                     if inferred_freq is not None:
-                        dsq["freq"] = inferred_freq
+                        ds["freq"] = inferred_freq
             else:
                 raise ValueError(
-                    f"Unsupported observation file format: {self._obs.suffix}"
+                    f"Unsupported observation file format: {obs_path.suffix}"
                 )
-            return dsq
-
-        entries = list(self._obs)
+            return ds
 
         # Collect per-entry parsed series and metadata
-        per_entry_series: List[pd.Series] = []
+        per_entry_values: List[np.ndarray] = []
         per_entry_time_index: List[pd.DatetimeIndex] = []
         per_entry_meta: List[Dict] = []
 
-        for e in entries:
+        # timestamps given as (date, value) pairs are parsed all at once
+        # after the loop: `raw_times` holds them back to back, and
+        # `pending` the entry positions and lengths to split them back
+        raw_times: List = []
+        pending: List[tuple] = []
+
+        # Unique computational_unit ids and observation types in first-seen
+        # order, along with the first encountered cu_kind (e.g., 'subbasin'),
+        # gathered in the same pass
+        seen_ids: List[int] = []
+        id_to_first_index: Dict[int, int] = {}
+        types: Dict[str, None] = {}
+        cu_kind: str | None = None
+
+        # the entries are iterated in place rather than copied
+        for e in self._obs:
             ts = e.get("timeseries", [])
             if len(ts) == 0:
                 idx = pd.DatetimeIndex([])
                 vals = np.array([], dtype=float)
             elif isinstance(ts, pd.Series):
-                idx = pd.to_datetime(ts.index)
+                idx = ts.index
+                if not isinstance(idx, pd.DatetimeIndex):
+                    idx = pd.to_datetime(idx, cache=True)
                 vals = ts.to_numpy(dtype=float)
             else:
-                t, v = zip(*ts)
-                idx = pd.to_datetime(list(t))
-                vals = np.array(list(v), dtype=float)
-
-            per_entry_series.append(pd.Series(vals, index=idx))
+                # split the (date, value) pairs in a single pass, appending
+                # the dates straight to `raw_times`
+                n = len(ts)
+                vals = np.empty(n, dtype=float)
+                for i, (ti, vi) in enumerate(ts):
+                    raw_times.append(ti)
+                    vals[i] = vi
+                pending.append((len(per_entry_time_index), n))
+                idx = None # parsed below
+
+            per_entry_values.append(vals)
             per_entry_time_index.append(idx)
 
-            per_entry_meta.append(
-                dict(
-                    name=e.get("name"),
-                    typ=e.get("type"),
-                    unit=e.get("unit"),
-                    cu_kind=e.get("computational_unit"),
-                    cu_id=e.get("computational_unit_id"),
-                    freq=e.get("freq"),
-                )
+            m = dict(
+                name=e.get("name"),
+                typ=e.get("type"),
+                unit=e.get("unit"),
+                cu_kind=e.get("computational_unit"),
+                cu_id=e.get("computational_unit_id"),
+                freq=e.get("freq"),
             )
+            per_entry_meta.append(m)
+
+            if m["cu_id"] not in id_to_first_index:
+                id_to_first_index[m["cu_id"]] = len(seen_ids)
+                seen_ids.append(m["cu_id"])
+            types.setdefault(m["typ"])
+            if cu_kind is None:
+                cu_kind = m["cu_kind"]
+
+        # Parse the pending timestamps in a single call, so the parser is
+        # set up once and repeated dates (e.g., shared by several stations)
+        # are converted only once; ISO 8601 dates, the common case, skip
+        # the format inference
+        if pending:
+            all_times = None
+            for kwargs in ({'format': 'ISO8601'}, {}):
+                try:
+                    all_times = pd.to_datetime(raw_times, cache=True, **kwargs)
+                except (ValueError, TypeError):
+                    # not ISO 8601 (or pandas < 2.0), or entries use
+                    # different date formats
+                    continue
+                if not isinstance(all_times, pd.DatetimeIndex):
+                    # entries with different UTC offsets are returned as
+                    # an object `Index`, not a `DatetimeIndex`
+                    all_times = None
+                break
+
+            start = 0
+            for pos, n in pending:
+                if all_times is not None:
+                    per_entry_time_index[pos] = all_times[start:start + n]
+                else:
+                    # parse the entries one by one
+                    per_entry_time_index[pos] = pd.to_datetime(raw_times[start:start + n])
+                start += n
 
         # Global coordinates
         global_time = union_sorted_times(per_entry_time_index)
+        # raw (UTC, for tz-aware indices) nanosecond values, used to align
+        # the entries with NumPy alone
+        global_ns = global_time.values.astype('datetime64[ns]')
 
-        # Unique computational_unit ids in first-seen order
-        seen_ids: List[int] = []
-        id_to_first_index: Dict[int, int] = {}
-        for m in per_entry_meta:
-            cu_id = m["cu_id"]
-            if cu_id not in id_to_first_index:
-                id_to_first_index[cu_id] = len(seen_ids)
-                seen_ids.append(cu_id)
         cu_ids = np.array(seen_ids)
         n_cu = len(cu_ids)
         n_time = len(global_time)
 
-        # Coordinate arrays per computational unit
-        names_by_id: Dict[int, str] = {}
-        freq_by_id: Dict[int, str] = {}
-        cu_kind: str | None = None
+        # Coordinate values per computational unit (row), recorded the first
+        # time a name or frequency is given for it
+        names: List = [None] * n_cu
+        freqs: List = [None] * n_cu
 
-        # Prepare containers per type
-        arrays_by_type: Dict[str, np.ndarray] = {}
+        # Values of each type as (row, columns, values) parts, scattered
+        # into the (cu, time) matrices once all entries are aligned
+        parts_by_type: Dict[str, List[tuple]] = {typ: [] for typ in types}
         unit_by_type: Dict[str, str] = {}
 
-        def _ensure_matrix_for_type(typ: str):
-            if typ not in arrays_by_type:
-                arrays_by_type[typ] = np.full((n_cu, n_time), np.nan, dtype=float)
-
-        # First encountered cu_kind (e.g., 'subbasin')
-        for m in per_entry_meta:
-            if m["cu_kind"] is not None:
-                cu_kind = cu_kind or m["cu_kind"]
         # assign `dim_name` to cu_kind
         dim_name = cu_kind
 
         # Fill matrices
-        for s, m in zip(per_entry_series, per_entry_meta):
+        for idx, vals, m in zip(per_entry_time_index, per_entry_values, per_entry_meta):
             typ = m["typ"]
             unit = m["unit"]
             cu_id = m["cu_id"]
             name = m["name"]
             freq = m["freq"]
 
-            if cu_id not in names_by_id and name is not None:
-                names_by_id[cu_id] = name
-            if cu_id not in freq_by_id and freq is not None:
-                freq_by_id[cu_id] = freq
-
-            _ensure_matrix_for_type(typ)
+            row = id_to_first_index[cu_id]
+            if names[row] is None:
+                names[row] = name
+            if freqs[row] is None:
+                freqs[row] = freq
 
             # Set reference unit for this type
             if typ not in unit_by_type:
@@ -464,22 +851,45 @@ class Calibration(object):
                             f"{unit} vs {unit_by_type[typ]}"
                         )
 
-            # Align times
-            s_aligned = s.reindex(global_time)
-
             # Convert units if needed
             if unit != unit_by_type[typ]:
-                q = s_aligned.to_numpy() * ureg(unit)
-                s_aligned_vals = q.to(unit_by_type[typ]).magnitude
-            else:
-                s_aligned_vals = s_aligned.to_numpy()
+                scale, offset = _unit_conversion(unit, unit_by_type[typ])
+                vals = vals * scale + offset
 
-            row = id_to_first_index[cu_id]
-            arrays_by_type[typ][row, :] = s_aligned_vals
+            # Align times: every timestamp of the entry is part of the
+            # sorted `global_time`, so a binary search gives its column
+            pos = np.searchsorted(global_ns, idx.values.astype('datetime64[ns]'))
 
-        # Build coords
-        name_arr = np.array([names_by_id.get(cu, None) for cu in cu_ids], dtype=str)
-        freq_arr = np.array([freq_by_id.get(cu, None) for cu in cu_ids], dtype=str)
+            parts_by_type[typ].append((row, pos, vals))
+
+        arrays_by_type: Dict[str, np.ndarray] = {}
+        if lazy:
+            # one Dask chunk per block of rows, filled on compute
+            for typ, parts in parts_by_type.items():
+                arrays_by_type[typ] = _lazy_matrix(parts, n_cu, n_time, dtype)
+        else:
+            # a single (type, cu, time) block is allocated and NaN-filled
+            # once, each type being a view on it
+            obs_block = np.full((len(types), n_cu, n_time), np.nan, dtype=dtype)
+            for i, (typ, parts) in enumerate(parts_by_type.items()):
+                arr = obs_block[i]
+                if parts:
+                    # scatter all entries of the type with one fancy-indexed
+                    # assignment over the concatenated (row, column) pairs
+                    rows = np.concatenate([
+                        np.full(len(pos), row, dtype=np.intp)
+                        for row, pos, _ in parts
+                    ])
+                    arr[rows, np.concatenate([pos for _, pos, _ in parts])] = \
+                        np.concatenate([vals for _, _, vals in parts])
+                arrays_by_type[typ] = arr
+
+        # Build coords; object arrays keep references to the Python strings
+        # (no fixed-width copies) and are written as variable-length strings.
+        # Missing names or frequencies are written as "None", as `eval.py`
+        # relies on real frequencies sorting before it
+        name_arr = np.array([str(n) for n in names], dtype=object)
+        freq_arr = np.array([str(f) for f in freqs], dtype=object)
 
         coords = {
             dim_name: cu_ids,
@@ -498,27 +908,26 @@ class Calibration(object):
         if cu_kind is not None:
             ds.attrs["computational_unit_kind"] = cu_kind
 
-        # return ds
-
-        # Quantify using the SAME registry we configured above
-        quantify_map = {typ: unit for typ, unit in unit_by_type.items()}
-        dsq = ds.pint.quantify(quantify_map, unit_registry=ureg)
+        # units are kept as attributes only; `observations_quantified`
+        # wraps the variables into Pint quantities when needed
+        return ds
 
-        return dsq
-    @observations.setter
-    def observations(self, value: List[Dict] | pd.Series) -> None:
-        """Set observational inputs.
+    @property
+    def observations_quantified(
+        self,
+    ) -> 'xr.Dataset':
+        """Observations dataset quantified with the module's Pint registry.
 
-        Parameters
-        ----------
-        value : list of dict or pandas.Series
-            Observation definitions or a pre-built series that will be parsed
-            into an internal xarray dataset by the getter.
+        Returns
+        -------
+        xarray.Dataset
+            The ``observations`` dataset with each variable wrapped into a
+            :class:`pint.Quantity` based on its ``units`` attribute.
         """
-        if not isinstance(value, list | pd.Series):
-            raise TypeError("`observations` must be a list of dictionaries or a pandas Series.")
-        self._obs = value
-        return
+        # Quantify using the SAME registry we configured above; building it
+        # first also registers the `.pint` accessor
+        ureg = _get_ureg()
+        return self.observations.pint.quantify(unit_registry=ureg)
 
     def to_dict(self) -> dict:
         """Convert the object to a dictionary.
@@ -553,20 +962,24 @@ class Calibration(object):
         self.model.analyze()
         self.model.prepare()
 
-        # 2. calibration part
-        self.calibration.generate_optimizer_templates(output_path=output_path)
-        self.calibration.generate_parameter_templates(output_path=output_path)
-        self.calibration.generate_etc_templates(output_path=output_path)
-        self.calibration.generate_model_templates(output_path=output_path)
-        self.calibration.generate_obs_templates(output_path=output_path)
+        # 2. calibration part; the generators write separate files, so
+        # they run concurrently once the instance layout exists
+        self.calibration.generate_all(output_path=output_path, max_workers=5)
 
-        # 3. observation part
-        self.observations.to_netcdf(
+        # 3. observation part; unless they are already built in memory, the
+        # observations are streamed to disk chunk by chunk, and the
+        # NaN-padded matrices compress well
+        if self._obs_cache is not None and self._obs_cache_key == id(self._obs):
+            observations = self._obs_cache
+        else:
+            observations = self.observations_lazy
+        observations.to_netcdf(
             os.path.join(
                 output_path,
                 'observations',
                 'observations.nc'
-            )
+            ),
+            encoding=_netcdf_encoding(observations),
         )
 
         # 4. evaluation part
@@ -589,16 +1002,18 @@ class Calibration(object):
         """
         # import necessary model-specific workflow package for
         # evaluation needs
-        match self.model_software:
-            case 'mesh':
-                import meshflow as mf
-            case _:
-                raise ValueError(f"Unsupported model software: {self.model_software}")
+        try:
+            workflow = _MODEL_WORKFLOWS[self.model_software]
+        except KeyError:
+            raise ValueError(f"Unsupported model software: {self.model_software}") from None
+        import_module(workflow)
+
+        instance_path = self.calibration_config.get('instance_path')
 
         # Making a dictionary of only necessary information during the evaluation
         # process for both calibration and model objects
         eval_dict = {
-            'fiat_instance_path': self.calibration_config.get('instance_path'),
+            'fiat_instance_path': instance_path,
             # because the `eval.py` script will eventually be saved under
             # `<fiat_cache_path>/cpu_<n>/etc/evaluation/`, the model instance
             # path is set to:
@@ -614,7 +1029,7 @@ class Calibration(object):
             'results_path': 'results',
             'output_files': [self.model.outputs],
             'observations_file': os.path.join(
-                self.calibration_config.get('instance_path'),
+                instance_path,
                 'observations',
                 'observations.nc'
             ),
@@ -627,36 +1042,33 @@ class Calibration(object):
             # `parameters` need to be recreated in each iteration
             #  USING `EVAL` PATH
             'parameters': {
-                key: os.path.join('../eval', f'{key}.json')
+                key: f'../eval/{key}.json'
                          for key in self.model.parameters.keys()},
             # `others` are static in each iteration but necessary to
             # be read by the script---USING `TEMPLATES` PATH
             'others': {
-                key: os.path.join('../templates', f'{key}.json')
+                key: f'../templates/{key}.json'
                          for key in self.model.others.keys()}
         }
 
         # dumping the dictionary into a JSON file for the evaluation script
-        eval_path = os.path.join(
-            self.calibration_config.get('instance_path'),
-            'etc',
-            'eval',
-            'eval.json'
-        )
+        eval_dir = os.path.join(instance_path, 'etc', 'eval')
+        eval_path = os.path.join(eval_dir, 'eval.json')
+        # `eval.json` is only read by `eval.py`, so it is written compactly
         with open(eval_path, 'w') as f:
-            json.dump(eval_dict, f, indent=4)
-
-        # now also move the eval.py file
-        rq = files('fiatmodel.models.mesh').joinpath('eval.py')
-
-        with as_file(rq) as src_path:
-            shutil.copy2(src_path, os.path.join(eval_dict['fiat_instance_path'], 'etc', 'eval', 'eval.py'))
-
-        # also copy the defaults.json file
-        rq_defaults = files('fiatmodel.models.mesh').joinpath('defaults.json')
-
-        with as_file(rq_defaults) as src_defaults_path:
-            shutil.copy2(src_defaults_path, os.path.join(eval_dict['fiat_instance_path'], 'etc', 'eval', 'defaults.json'))
+            f.write(json.dumps(eval_dict, separators=(',', ':')))
+
+        # now also copy the eval.py and defaults.json files; `copyfile`
+        # skips the metadata copy and leaves shutil free to use its fast
+        # in-kernel copy, but `eval.py` is run directly by the calibration
+        # engine, so its permission bits are copied as well
+        package = files('fiatmodel.models.mesh')
+        for name in ('eval.py', 'defaults.json'):
+            with as_file(package.joinpath(name)) as src_path:
+                dst_path = os.path.join(eval_dir, name)
+                shutil.copyfile(src_path, dst_path)
+                if name == 'eval.py':
+                    shutil.copymode(src_path, dst_path)
 
         return
 
@@ -677,6 +1089,7 @@ class Calibration(object):
             'model_software': self.model_software,
             'calibration_config': self.calibration_config,
             'model_config': self.model_config,
+            'precision': self.precision,
             'observations': self._obs,
         }
 
@@ -691,11 +1104,16 @@ class Calibration(object):
                         ts.index.astype(str).to_list(),
                         ts.to_numpy(dtype=float).tolist()
                     ))
+                elif len(ts) > 0:
+                    # make sure all values are converted to float; dates and
+                    # values are converted column-wise rather than per pair
+                    times, values = zip(*ts)
+                    obs['timeseries'] = list(zip(
+                        map(str, times),
+                        np.asarray(values, dtype=float).tolist()
+                    ))
                 else:
-                    # make sure all values are converted to float
-                    obs['timeseries'] = list(
-                        (str(t), float(v)) for t, v in ts
-                    )
+                    obs['timeseries'] = []
 
         if output_path is None:
             output_path = self.calibration_config.get('instance_path')
@@ -9,22 +9,21 @@ from typing import (
     Dict,
     Sequence,
     Union,
+    TypeAlias,
 )
 from pathlib import Path
 
-import sys
 import warnings
 
 # internal imports
-from ..calibration import available_calibration_software
+from ..calibration import (
+    available_calibration_software,
+    _available_calibration_software_set,
+)
 
 # custom types
 # PathLike type alias for file system paths
-if sys.version_info >= (3, 10):
-    from typing import TypeAlias
-    PathLike: TypeAlias = Union[str, Path]
-else:
-    PathLike = Union[str, Path]
+PathLike: TypeAlias = Union[str, Path]
 # NameType type alias for parameter names
 NameType = Union[str, int, float]
 
@@ -128,7 +127,7 @@ class ModelBuilder(object):
         self.calibration_software = calibration_software
 
         # check whether a valid calibration software is provided
-        if self.calibration_software.lower() not in available_calibration_software:
+        if self.calibration_software.lower() not in _available_calibration_software_set:
             raise ValueError(
                 f"Unsupported calibration software: {self.calibration_software}. "
                 f"Available options are: {available_calibration_software}"
@@ -35,7 +35,6 @@ Run the script directly after FIAT prepares the evaluation assets::
 # built-in imports
 import subprocess
 import os
-import re
 import json
 import shutil
 import warnings
@@ -71,17 +70,9 @@ import meshflow as mf
 with open(os.path.join('./etc/eval/defaults.json'), 'r') as f:
     DEFAULTS = json.load(f)
 
-# Precompile regexes for speed/readability
-_INT_RE = re.compile(r'^[-+]?\d+$')
-_FLOAT_RE = re.compile(
-    r"""^[-+]?(                # optional sign
-        (?:\d+\.\d*|\d*\.\d+)  # something with a decimal point
-        (?:[eE][-+]?\d+)?      # optional exponent
-        |
-        \d+[eE][-+]?\d+        # or integer with exponent (e.g. 1e6)
-    )$""",
-    re.X
-)
+# characters a numeric-looking string may start with and consist of
+_NUMERIC_LEADING = frozenset('0123456789+-.')
+_NUMERIC_CHARS = frozenset('0123456789+-.eE')
 
 # default environment
 my_env = os.environ.copy()
@@ -118,45 +109,54 @@ def _parse_numeric_string(s: str) -> Union[int, float, str]:
     >>> _parse_numeric_string("abc")
     'abc'
     """
-    if _INT_RE.match(s):
+    # most strings (names, paths, units) are ruled out by their first
+    # character alone
+    if not s or s[0] not in _NUMERIC_LEADING:
+        return s
+    # optional sign followed by ASCII digits only; `int` alone would also
+    # accept underscores, surrounding whitespace, and non-ASCII digits
+    digits = s[1:] if s[:1] in ('+', '-') else s
+    if digits.isascii() and digits.isdigit():
         # Keep as int if it fits typical Python int (Python int is unbounded anyway)
         return int(s)
-    if _FLOAT_RE.match(s):
-        # Anything with decimal point or exponent
-        return float(s)
+    # anything with decimal point or exponent; the character check keeps
+    # `float` from accepting "nan", "inf", or underscores
+    if _NUMERIC_CHARS.issuperset(s):
+        try:
+            return float(s)
+        except ValueError:
+            pass
     return s  # not numeric-looking
 
-def _convert_numeric_strings(obj: Any) -> Any:
-    """Recursively convert numeric-like strings within mappings and sequences.
+def _convert_numeric_items(items: list) -> list:
+    """Convert numeric-like strings of a list in place.
 
-    Walks nested ``dict`` and ``list`` structures, converting any string values
-    that look numeric into ``int`` or ``float`` using
-    :func:`_parse_numeric_string`.
+    Nested lists are walked recursively; mappings are left untouched, as
+    the JSON object hook of :func:`_make_object_hook` has already converted
+    them by the time their enclosing list is visited.
 
     Parameters
     ----------
-    obj : Any
-        A Python object. If ``dict`` or ``list``, it will be traversed
-        recursively; all other types are returned as-is.
+    items : list
+        List decoded from JSON.
 
     Returns
     -------
-    Any
-        An object of the same structure as ``obj`` with numeric-like strings
-        converted to numbers.
+    list
+        The same ``items`` list, with numeric-like strings converted to
+        numbers using :func:`_parse_numeric_string`.
 
     Examples
     --------
-    >>> _convert_numeric_strings({"a": "1", "b": ["2.5", "x"]})
-    {'a': 1, 'b': [2.5, 'x']}
+    >>> _convert_numeric_items(["2.5", "x", ["1"]])
+    [2.5, 'x', [1]]
     """
-    if isinstance(obj, dict):
-        return {k: _convert_numeric_strings(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_convert_numeric_strings(v) for v in obj]
-    if isinstance(obj, str):
-        return _parse_numeric_string(obj.strip())
-    return obj  # leaves int, float, bool, None, etc. untouched
+    for i, v in enumerate(items):
+        if isinstance(v, str):
+            items[i] = _parse_numeric_string(v.strip())
+        elif isinstance(v, list):
+            _convert_numeric_items(v)
+    return items
 
 def _make_object_hook() -> Callable[[Dict[str, Any]], Dict[str, Any]]:
     """Create a ``json.loads`` object hook that converts numeric-like strings.
@@ -165,12 +165,21 @@ def _make_object_hook() -> Callable[[Dict[str, Any]], Dict[str, Any]]:
     -------
     callable
         A function suitable for use as ``object_hook`` in :func:`json.loads`
-        that applies :func:`_convert_numeric_strings` to every decoded mapping.
+        that converts the numeric-like strings of every decoded mapping in
+        place.
+
+    Notes
+    -----
+    The decoder calls the hook on the innermost mappings first, so nested
+    mappings are already converted and only strings and lists are visited.
     """
 
     def object_hook(d):
         for k, v in d.items():
-            d[k] = _convert_numeric_strings(v)  # reuse earlier function
+            if isinstance(v, str):
+                d[k] = _parse_numeric_string(v.strip())
+            elif isinstance(v, list):
+                _convert_numeric_items(v)
         return d
     return object_hook
 
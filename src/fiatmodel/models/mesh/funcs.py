@@ -10,23 +10,19 @@ from typing import (
     Union,
     List,
     Tuple,
+    TypeAlias,
 )
 from pathlib import Path
 
 import re
 import os
-import sys
 
 # NameType type alias for parameter names
 NameType = Union[str, int, float]
 
 # custom types
 # PathLike type alias for file system paths
-if sys.version_info >= (3, 10):
-    from typing import TypeAlias
-    PathLike: TypeAlias = Union[str, Path]
-else:
-    PathLike = Union[str, Path]
+PathLike: TypeAlias = Union[str, Path]
 
 def remove_comments(
     string
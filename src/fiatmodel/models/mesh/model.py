@@ -10,13 +10,13 @@ import xarray as xr
 import re
 import os
 import shutil
-import sys
 
 from typing import (
     Dict,
     Sequence,
     Union,
     List,
+    TypeAlias,
 )
 from datetime import (
     datetime,
@@ -33,11 +33,7 @@ from .funcs import *
 
 # custom types
 # PathLike type alias for file system paths
-if sys.version_info >= (3, 10):
-    from typing import TypeAlias
-    PathLike: TypeAlias = Union[str, Path]
-else:
-    PathLike = Union[str, Path]
+PathLike: TypeAlias = Union[str, Path]
 # NameType type alias for parameter names
 NameType = Union[str, int, float]
 
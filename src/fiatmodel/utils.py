@@ -3,6 +3,7 @@
 from typing import List
 
 # external
+import numpy as np
 import pandas as pd
 
 # "private" global helper functions
@@ -23,6 +24,8 @@ def union_sorted_times(all_times: List[pd.DatetimeIndex]) -> pd.DatetimeIndex:
     Notes
     -----
     - Operates with set-union semantics; duplicate timestamps are removed.
+    - Indices sharing the same timezone are merged with a single
+      :func:`numpy.unique` over their concatenated values.
     - The resulting index does not guarantee a fixed frequency (`freq=None`).
     - For best results, ensure all input indices share the same timezone
       awareness to avoid pandas warnings.
@@ -35,9 +38,25 @@ def union_sorted_times(all_times: List[pd.DatetimeIndex]) -> pd.DatetimeIndex:
     >>> union_sorted_times([a, b])
     DatetimeIndex(['2020-01-01', '2020-01-02', '2020-01-03'], dtype='datetime64[ns]', freq=None)
     """
-    if not all_times:
+    # empty indices do not contribute to the union
+    non_empty = [t for t in all_times if len(t)]
+    if not non_empty:
         return pd.DatetimeIndex([])
-    out = all_times[0]
-    for t in all_times[1:]:
-        out = out.union(t)
-    return out.sort_values()
+
+    # mixed timezones are left to pandas' own union rules
+    tz = non_empty[0].tz
+    if any(t.tz != tz for t in non_empty[1:]):
+        out = non_empty[0]
+        for t in non_empty[1:]:
+            out = out.union(t)
+        return out.sort_values()
+
+    # concatenate the raw (UTC, for tz-aware indices) nanosecond values
+    # and sort/deduplicate them in a single pass
+    values = np.unique(np.concatenate([
+        t.values.astype('datetime64[ns]') for t in non_empty
+    ]))
+    out = pd.DatetimeIndex(values)
+    if tz is not None:
+        out = out.tz_localize('UTC').tz_convert(tz)
+    return out